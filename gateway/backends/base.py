@@ -15,7 +15,19 @@ class BackendBase(ABC):
 
     name: str  # unique backend name, set per instance
 
+    async def open(self) -> None:
+        """Acquire long-lived resources (e.g. connection pools). Called at app startup."""
+
+    async def aclose(self) -> None:
+        """Release resources acquired in ``open()``. Called at app shutdown."""
+
     @abstractmethod
-    async def generate(self, body: dict[str, Any], request_id: str) -> dict[str, Any]:
-        """Non-streaming completion. Returns an OpenAI-shaped response dict."""
+    async def generate(
+        self, body: dict[str, Any], request_id: str, *, payload: bytes | None = None
+    ) -> dict[str, Any]:
+        """Non-streaming completion. Returns an OpenAI-shaped response dict.
+
+        ``payload`` is ``body`` already serialized to JSON by the caller; backends
+        that send the body over the wire use it instead of encoding again.
+        """
         ...
@@ -13,7 +13,9 @@ class EchoBackend(BackendBase):
     def __init__(self, name: str = "local") -> None:
         self.name = name
 
-    async def generate(self, body: dict[str, Any], request_id: str) -> dict[str, Any]:
+    async def generate(
+        self, body: dict[str, Any], request_id: str, *, payload: bytes | None = None
+    ) -> dict[str, Any]:
         messages = body.get("messages", [])
         prompt = ""
         for msg in reversed(messages):
@@ -23,7 +25,8 @@ class EchoBackend(BackendBase):
 
         content = f"Echo: {prompt}"
         prompt_tokens = len(prompt.split())
-        completion_tokens = len(content.split())
+        # "Echo: " + prompt splits into ["Echo:", *prompt.split()] — no second scan.
+        completion_tokens = prompt_tokens + 1
 
         return {
             "id": request_id,
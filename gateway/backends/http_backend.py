@@ -7,6 +7,20 @@ from typing import Any
 import httpx
 
 from gateway.backends.base import BackendBase
+from gateway.jsonlib import dumps, loads
+
+# Keep-alive pool shared by every request through one client; HTTP/2 is
+# negotiated via ALPN on TLS upstreams (e.g. Modal) and multiplexes streams.
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=200, max_connections=400)
+
+# Bodies are pre-encoded with orjson and sent as ``content=``; httpx's ``json=``
+# would serialize them again with the stdlib encoder.
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def make_async_client(timeout: float = 60.0) -> httpx.AsyncClient:
+    """Build a pooled, HTTP/2-capable client for upstream calls."""
+    return httpx.AsyncClient(timeout=timeout, limits=HTTP_LIMITS, http2=True)
 
 
 class HttpBackend(BackendBase):
@@ -25,12 +39,24 @@ class HttpBackend(BackendBase):
         self.timeout = timeout
         self.model = model  # if set, injected as "model" in the forwarded body
         self.max_model_len = max_model_len  # if set, gateway rejects oversized requests
+        self._client: httpx.AsyncClient | None = None
 
     @property
     def completions_url(self) -> str:
         return self.base_url + "/v1/chat/completions"
 
-    async def generate(self, body: dict[str, Any], request_id: str) -> dict[str, Any]:
+    async def open(self) -> None:
+        if self._client is None:
+            self._client = make_async_client(self.timeout)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def generate(
+        self, body: dict[str, Any], request_id: str, *, payload: bytes | None = None
+    ) -> dict[str, Any]:
         """Forward the request to the remote backend and return the response dict.
 
         Raises:
@@ -38,13 +64,21 @@ class HttpBackend(BackendBase):
             httpx.RequestError: connection-level failure
             RuntimeError: backend returned 5xx or unparseable response
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.post(self.completions_url, json=body)
+        content = dumps(body) if payload is None else payload
+        if self._client is not None:
+            resp = await self._client.post(
+                self.completions_url, content=content, headers=JSON_HEADERS
+            )
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                resp = await client.post(
+                    self.completions_url, content=content, headers=JSON_HEADERS
+                )
 
         if resp.status_code >= 500:
             raise RuntimeError(f"backend_error:{resp.status_code}")
 
         try:
-            return resp.json()
+            return loads(resp.content)
         except Exception as exc:
             raise RuntimeError("backend_invalid_response") from exc
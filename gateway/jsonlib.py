@@ -0,0 +1,24 @@
+"""JSON encode/decode helpers — orjson when installed, stdlib fallback otherwise."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+if _ORJSON_AVAILABLE:
+    loads = orjson.loads
+    dumps = orjson.dumps
+else:
+    loads = json.loads
+
+    def dumps(obj: Any) -> bytes:
+        """Compact UTF-8 JSON bytes, matching orjson's output shape."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
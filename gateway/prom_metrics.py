@@ -102,4 +102,5 @@ RESPONSE_SIZE_BYTES = Histogram(
 ACTIVE_REQUESTS = Gauge(
     "gateway_active_requests",
     "Number of requests currently being processed",
+    multiprocess_mode="livesum",  # summed across live prefork workers
 )
@@ -3,17 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import contextlib
-import json
 import logging
+import logging.handlers
+import queue
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import threading
 import time
-import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, AsyncIterator, Mapping
 
 import httpx
-import prometheus_client
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.responses import JSONResponse, StreamingResponse
@@ -22,13 +28,151 @@ from pathlib import Path
 
 load_dotenv()
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(message)s",
-)
+# prometheus_client chooses its value backend when first imported, so prefork
+# workers (GATEWAY_WORKERS > 1) must point it at a shared directory before then.
+# The supervisor aggregates that directory on the single GATEWAY_METRICS_PORT.
+if int(os.environ.get("GATEWAY_WORKERS", "1")) > 1 and not os.environ.get(
+    "PROMETHEUS_MULTIPROC_DIR"
+):
+    _prom_dir = tempfile.mkdtemp(prefix="gateway-prometheus-")
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = _prom_dir
+    atexit.register(shutil.rmtree, _prom_dir, True)
+
+import prometheus_client  # noqa: E402
+from prometheus_client import multiprocess as prometheus_multiprocess  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Logging — records are queued by the caller and written by a listener thread
+# ---------------------------------------------------------------------------
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records untouched; formatting happens on the writer thread.
+
+    The stock ``prepare()`` formats every message on the calling thread (the
+    event loop) so records can be pickled; this queue never leaves the process.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _BatchStreamHandler(logging.StreamHandler):
+    """StreamHandler that writes a batch of records with one write and one flush."""
+
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        parts = []
+        for record in records:
+            try:
+                parts.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+        if parts:
+            with self.lock:
+                self.stream.write("".join(parts))
+            self.flush()
+
+
+class _BatchQueueListener:
+    """Like QueueListener, but each wake-up drains every queued record as one batch."""
+
+    def __init__(
+        self,
+        log_queue: queue.SimpleQueue[logging.LogRecord | None],
+        handler: _BatchStreamHandler,
+    ) -> None:
+        self.queue = log_queue
+        self.handler = handler
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._monitor, name="gateway-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self.queue.put_nowait(None)  # sentinel: write what is queued, then exit
+            self._thread.join()
+            self._thread = None
+
+    def _monitor(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    batch.append(self.queue.get_nowait())
+            records = [r for r in batch if r is not None]
+            if records:
+                self.handler.emit_batch(records)
+            if len(records) < len(batch):
+                return
+
+
+_log_handler: _DeferredQueueHandler | None = None
+_log_listener: _BatchQueueListener | None = None
+
+
+def _start_log_listener() -> None:
+    """(Re)attach a fresh queue and writer thread to the root queue handler."""
+    global _log_listener
+    if _log_handler is None:
+        return
+    log_queue: queue.SimpleQueue[logging.LogRecord | None] = queue.SimpleQueue()
+    _log_handler.queue = log_queue
+    stream = _BatchStreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    _log_listener = _BatchQueueListener(log_queue, stream)
+    _log_listener.start()
+
+
+def _stop_log_listener() -> None:
+    """Flush queued records and join the writer thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+def _setup_logging() -> None:
+    """Like basicConfig(level=INFO), but logs are formatted and written off-loop.
+
+    Records are enqueued untouched; a writer thread formats each drained batch
+    and writes it with a single write and flush.
+
+    A no-op when the root logger is already configured. Forked workers lose the
+    listener thread, so each child starts its own on a fresh queue.
+    """
+    global _log_handler
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    _log_handler = _DeferredQueueHandler(queue.SimpleQueue())
+    root.addHandler(_log_handler)
+    root.setLevel(logging.INFO)
+    _start_log_listener()
+    atexit.register(_stop_log_listener)
+    os.register_at_fork(after_in_child=_start_log_listener)
+
+
+_setup_logging()
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# pysimdjson (optional — lazy parsing of backend completion bodies)
+# ---------------------------------------------------------------------------
+
+try:
+    import simdjson
+
+    _simd_parser: simdjson.Parser | None = simdjson.Parser()
+except ImportError:
+    _simd_parser = None
+
+
 # ---------------------------------------------------------------------------
 # OpenTelemetry (optional — zero overhead when OTEL_TRACES_EXPORTER != "otlp")
 # ---------------------------------------------------------------------------
@@ -71,7 +215,7 @@ def _setup_otel() -> None:
 
 
 @contextlib.contextmanager
-def _span(name: str, carrier: dict | None = None, **attrs):
+def _span(name: str, carrier: Mapping[str, str] | None = None, **attrs):
     """Start a tracing span from the incoming W3C context. Yields None when OTel is off."""
     if not _OTEL_AVAILABLE:
         yield None
@@ -95,7 +239,10 @@ def _span_event(name: str, **attrs) -> None:
 
 def _outgoing_headers(technique: str) -> dict[str, str]:
     """Build upstream request headers, injecting W3C trace context when OTel is active."""
-    headers: dict[str, str] = {"X-Technique": technique}
+    headers: dict[str, str] = {
+        "Content-Type": "application/json",
+        "X-Technique": technique,
+    }
     if _OTEL_AVAILABLE:
         _otel_inject(headers)
     return headers
@@ -106,7 +253,7 @@ def _outgoing_headers(technique: str) -> dict[str, str]:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     port: int = field(default_factory=lambda: int(os.environ.get("PORT", "8080")))
     backend_url: str | None = field(
@@ -124,6 +271,17 @@ class Settings:
     vllm_server_profile: str = field(
         default_factory=lambda: os.environ.get("VLLM_SERVER_PROFILE", "default")
     )
+    workers: int = field(
+        default_factory=lambda: int(os.environ.get("GATEWAY_WORKERS", "1"))
+    )
+    max_body_bytes: int = field(
+        default_factory=lambda: int(
+            os.environ.get("GATEWAY_MAX_BODY_BYTES", str(8 * 1024 * 1024))
+        )
+    )
+    listen_backlog: int = field(
+        default_factory=lambda: int(os.environ.get("GATEWAY_LISTEN_BACKLOG", "2048"))
+    )
     metrics_log_dir: str | None = field(
         default_factory=lambda: (
             os.environ.get("GATEWAY_METRICS_LOG_DIR", "logs/gateway") or "logs/gateway"
@@ -139,7 +297,8 @@ settings = Settings()
 # ---------------------------------------------------------------------------
 
 from gateway.config import GatewayConfig, load_config  # noqa: E402
-from gateway.backends.http_backend import HttpBackend  # noqa: E402
+from gateway.jsonlib import dumps as _dumps, loads as _loads  # noqa: E402
+from gateway.backends.http_backend import HttpBackend, make_async_client  # noqa: E402
 from gateway.prom_metrics import (  # noqa: E402
     ACTIVE_REQUESTS,
     BACKEND_REQUEST_DURATION_SECONDS,
@@ -167,8 +326,14 @@ gateway_config: GatewayConfig | None = (
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Metrics:
+    """Legacy JSON counters.
+
+    Only mutated from the event-loop thread (handlers are coroutines), so plain
+    attribute adds need no locks or per-thread shards.
+    """
+
     request_count: int = 0
     error_count: int = 0
     total_latency_ms: float = 0.0
@@ -262,8 +427,8 @@ async def _append_gateway_metrics_log(row: dict[str, Any]) -> None:
         fpath = path / f"gateway_metrics_{day}.jsonl"
 
         def _write() -> None:
-            with open(fpath, "a", encoding="utf-8") as fp:
-                fp.write(json.dumps(row, ensure_ascii=False) + "\n")
+            with open(fpath, "ab") as fp:
+                fp.write(_dumps(row) + b"\n")
 
         await asyncio.to_thread(_write)
 
@@ -273,6 +438,45 @@ async def _append_gateway_metrics_log(row: dict[str, Any]) -> None:
 # ---------------------------------------------------------------------------
 
 
+_JSON_CONTENT_TYPE = (b"content-type", b"application/json")
+
+
+class _JSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (stdlib fallback via gateway.jsonlib).
+
+    ``bytes`` content is taken as already-serialized JSON. Headers are built
+    straight into the raw ASGI list from a fixed content-type pair, skipping
+    Starlette's generic header normalization.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return _dumps(content)
+
+    def init_headers(self, headers: Mapping[str, str] | None = None) -> None:
+        extra = (
+            [
+                (k.lower().encode("latin-1"), v.encode("latin-1"))
+                for k, v in headers.items()
+            ]
+            if headers
+            else []
+        )
+        keys = {k for k, _ in extra}
+        raw_headers = []
+        # Same guards as Starlette: no length on bodiless statuses, and never
+        # duplicate a content-length/content-type the caller supplied.
+        if b"content-length" not in keys and not (
+            self.status_code < 200 or self.status_code in (204, 304)
+        ):
+            raw_headers.append((b"content-length", b"%d" % len(self.body)))
+        if b"content-type" not in keys:
+            raw_headers.append(_JSON_CONTENT_TYPE)
+        raw_headers.extend(extra)
+        self.raw_headers = raw_headers
+
+
 def _normalize_response(
     data: dict[str, Any], request_id: str, latency_ms: float = 0.0
 ) -> dict[str, Any]:
@@ -310,32 +514,97 @@ def _normalize_response(
     }
 
 
-def build_response(
+_CHOICE_KEYS = ("index", "message", "finish_reason")
+
+
+def _plain(value: Any) -> Any:
+    """Materialize a simdjson proxy (Object/Array) into dict/list; pass scalars through."""
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+
+# Below this size a full orjson parse beats indexing plus per-field conversion
+# (~1.5 µs vs ~3.5 µs for a typical short completion); lazy decoding only pays
+# off once bodies carry bulky extras such as logprobs.
+_LAZY_DECODE_MIN_BYTES = 4096
+
+
+def _lazy_completion_fields(doc: Any) -> dict[str, Any] | None:
+    """Materialize the normalized fields of a parsed document; None on an unexpected shape.
+
+    Only plain Python objects are returned: a simdjson proxy that outlived this
+    call would keep the shared parser locked and fail every later parse.
+    """
+    if not isinstance(doc, simdjson.Object):
+        return None
+    choices = doc.get("choices")
+    if choices is not None and not isinstance(choices, simdjson.Array):
+        return None
+
+    data: dict[str, Any] = {}
+    for key in ("model", "usage"):
+        if key in doc:
+            data[key] = _plain(doc[key])
+    if choices is not None:
+        data["choices"] = [
+            {k: _plain(c[k]) for k in _CHOICE_KEYS if k in c}
+            if isinstance(c, simdjson.Object)
+            else _plain(c)
+            for c in choices
+        ]
+    return data
+
+
+def _decode_backend_completion(raw: bytes) -> dict[str, Any]:
+    """Decode only the fields ``_normalize_response`` reads from a backend body.
+
+    For bodies of at least ``_LAZY_DECODE_MIN_BYTES``, pysimdjson indexes the
+    document lazily and only ``model``, ``usage`` and each choice's
+    ``index``/``message``/``finish_reason`` become Python objects — extras like
+    ``logprobs`` or ``timings`` are never materialized. Smaller bodies, a
+    missing pysimdjson, or anything the lazy path rejects (invalid JSON, an
+    unexpected shape, integers beyond 64 bits) fall back to a full parse.
+    """
+    if _simd_parser is None or len(raw) < _LAZY_DECODE_MIN_BYTES:
+        return _loads(raw)
+    try:
+        data = _lazy_completion_fields(_simd_parser.parse(raw))
+    except (ValueError, RuntimeError):
+        data = None
+    # Fall back outside the except block so no traceback pins parser proxies.
+    return _loads(raw) if data is None else data
+
+
+# Echo completions differ only in their scalar fields, so they are %-formatted
+# straight into bytes instead of building and serializing a nested dict.
+_ECHO_TMPL = (
+    b'{"id":%b,"object":"chat.completion","model":"echo",'
+    b'"choices":[{"index":0,"message":{"role":"assistant","content":%b},'
+    b'"finish_reason":"stop"}],'
+    b'"usage":{"prompt_tokens":%d,"completion_tokens":%d,"total_tokens":%d,'
+    b'"latency_ms":%b}}'
+)
+
+
+def render_echo_response(
     request_id: str,
     content: str,
-    model: str = "echo",
-    prompt_tokens: int = 0,
-    completion_tokens: int = 0,
-    latency_ms: float = 0.0,
-) -> dict[str, Any]:
-    return {
-        "id": request_id,
-        "object": "chat.completion",
-        "model": model,
-        "choices": [
-            {
-                "index": 0,
-                "message": {"role": "assistant", "content": content},
-                "finish_reason": "stop",
-            }
-        ],
-        "usage": {
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-            "total_tokens": prompt_tokens + completion_tokens,
-            "latency_ms": round(latency_ms, 2),
-        },
-    }
+    prompt_tokens: int,
+    completion_tokens: int,
+    latency_ms: float,
+) -> bytes:
+    """Serialize an OpenAI-style ``chat.completion`` body for echo mode."""
+    return _ECHO_TMPL % (
+        _dumps(request_id),
+        _dumps(content),
+        prompt_tokens,
+        completion_tokens,
+        prompt_tokens + completion_tokens,
+        _dumps(round(latency_ms, 2)),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -343,6 +612,11 @@ def build_response(
 # ---------------------------------------------------------------------------
 
 
+# Fixed-label children resolved once instead of on every record_metrics() call.
+_PROMPT_TOKENS = TOKENS_TOTAL.labels(type="prompt")
+_COMPLETION_TOKENS = TOKENS_TOTAL.labels(type="completion")
+
+
 def record_metrics(
     status: int,
     latency_ms: float,
@@ -352,11 +626,12 @@ def record_metrics(
     technique: str = "baseline",
     server_profile: str = "default",
 ) -> None:
+    is_error = status >= 400
     metrics.request_count += 1
     metrics.total_latency_ms += latency_ms
     metrics.prompt_tokens_total += prompt_tokens
     metrics.completion_tokens_total += completion_tokens
-    if status >= 400:
+    if is_error:
         metrics.error_count += 1
 
     latency_s = latency_ms / 1000.0
@@ -370,9 +645,9 @@ def record_metrics(
         technique=technique,
         server_profile=server_profile,
     ).observe(latency_s)
-    TOKENS_TOTAL.labels(type="prompt").inc(prompt_tokens)
-    TOKENS_TOTAL.labels(type="completion").inc(completion_tokens)
-    if status >= 400:
+    _PROMPT_TOKENS.inc(prompt_tokens)
+    _COMPLETION_TOKENS.inc(completion_tokens)
+    if is_error:
         ERRORS_TOTAL.labels(
             status_code=str(status),
             technique=technique,
@@ -385,6 +660,44 @@ def record_metrics(
     ).inc(cost)
 
 
+def _error_response(
+    status: int,
+    body: dict[str, Any],
+    latency_ms: float,
+    request_id: str | None = None,
+    *,
+    technique: str = "baseline",
+    server_profile: str = "default",
+) -> Response:
+    """Record a failed request and build its JSON error response.
+
+    Callers measure ``latency_ms`` once at the exit point and reuse it for
+    their log line, instead of re-reading the clock per branch.
+    """
+    record_metrics(
+        status, latency_ms, 0, 0, technique=technique, server_profile=server_profile
+    )
+    headers = {"X-Request-ID": request_id} if request_id is not None else None
+    return _JSONResponse(body, status_code=status, headers=headers)
+
+
+async def _read_body_capped(request: Request, limit: int) -> bytearray | None:
+    """Read the request body, or return None as soon as it exceeds ``limit`` bytes.
+
+    A declared Content-Length is checked before any bytes are read; chunked
+    bodies are accumulated and abandoned once they cross the cap.
+    """
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > limit:
+        return None
+    buf = bytearray()
+    async for chunk in request.stream():
+        buf += chunk
+        if len(buf) > limit:
+            return None
+    return buf
+
+
 # ---------------------------------------------------------------------------
 # Token estimation (gateway-side guard for max_model_len)
 # ---------------------------------------------------------------------------
@@ -450,6 +763,26 @@ def _validate_body(body: dict[str, Any]) -> str | None:
     return None
 
 
+# ---------------------------------------------------------------------------
+# Request-ID
+# ---------------------------------------------------------------------------
+
+_urandom = os.urandom
+
+
+def _new_request_id() -> str:
+    """Random UUID v4 string, formatted straight from bytes.
+
+    Same output as ``str(uuid.uuid4())`` without building a ``UUID`` object
+    (int conversion, field parsing) for an ID that is only ever a string.
+    """
+    raw = bytearray(_urandom(16))
+    raw[6] = raw[6] & 0x0F | 0x40  # version 4
+    raw[8] = raw[8] & 0x3F | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 # ---------------------------------------------------------------------------
 # Auth dependency
 # ---------------------------------------------------------------------------
@@ -476,22 +809,74 @@ def check_auth(request: Request) -> None:
 @contextlib.asynccontextmanager
 async def _lifespan(app: FastAPI):
     app.state.metrics_log_lock = asyncio.Lock()
+    # One pooled client for all upstream calls — keep-alive connections are
+    # reused across requests instead of a TCP (+TLS) handshake per request.
+    app.state.http_client = make_async_client(60.0)
+    backends = gateway_config.all_backends if gateway_config is not None else []
+    for backend in backends:
+        await backend.open()
     mdir = settings.metrics_log_dir
     if not mdir or mdir.lower() in ("-", "none", "false", "0"):
         logger.info("JSONL request metrics logging disabled.")
     else:
         logger.info("JSONL metrics log dir: %s", Path(mdir).resolve())
-    yield
+    try:
+        yield
+    finally:
+        for backend in backends:
+            await backend.aclose()
+        await app.state.http_client.aclose()
 
 
-app = FastAPI(title="Inference Gateway", lifespan=_lifespan)
+app = FastAPI(
+    title="Inference Gateway",
+    lifespan=_lifespan,
+    default_response_class=_JSONResponse,
+)
 
 
 @app.exception_handler(HTTPException)
 async def _http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
     if isinstance(exc.detail, dict):
-        return JSONResponse(status_code=exc.status_code, content=exc.detail)
-    return JSONResponse(status_code=exc.status_code, content={"error": str(exc.detail)})
+        return _JSONResponse(status_code=exc.status_code, content=exc.detail)
+    return _JSONResponse(
+        status_code=exc.status_code, content={"error": str(exc.detail)}
+    )
+
+
+# Registered before the app's own GET routes: Starlette matches routes in
+# registration order, so the hot POST path is tried before the diagnostic
+# endpoints. FastAPI's docs routes (/openapi.json, /docs, /redoc), added in
+# FastAPI.__init__, still precede it.
+@app.post("/v1/chat/completions")
+async def chat_completions(
+    request: Request, _auth: None = Depends(check_auth)
+) -> Response:
+    start = time.monotonic()
+    request_id = (
+        request.headers.get("X-Request-ID")
+        or request.headers.get("Request-Id")
+        or _new_request_id()
+    )
+    technique = request.headers.get("X-Technique", "baseline")
+    server_profile = settings.vllm_server_profile
+
+    with _span(
+        "chat.completions",
+        request.headers,
+        technique=technique,
+        server_profile=server_profile,
+    ) as span:
+        ACTIVE_REQUESTS.inc()
+        try:
+            response = await _handle_completions(
+                request, request_id, technique, server_profile, start
+            )
+            if span is not None:
+                span.set_attribute("http.status_code", response.status_code)
+            return response
+        finally:
+            ACTIVE_REQUESTS.dec()
 
 
 _ENDPOINTS = [
@@ -533,26 +918,35 @@ _ENDPOINTS = [
 ]
 
 
+# Constant bodies serialized once at import; served without per-hit encoding.
+_INDEX_BYTES = _dumps({"service": "inference-gateway", "endpoints": _ENDPOINTS})
+_HEALTH_OK_BYTES = _dumps({"status": "ok", "upstream": None})
+_NOT_FOUND_BYTES = _dumps({"error": "not_found"})
+
+
+def _static_json(body: bytes, status_code: int = 200) -> Response:
+    return _JSONResponse(body, status_code=status_code)
+
+
 @app.get("/")
-async def index() -> dict[str, Any]:
-    return {"service": "inference-gateway", "endpoints": _ENDPOINTS}
+async def index() -> Response:
+    return _static_json(_INDEX_BYTES)
 
 
-@app.get("/health")
-async def health() -> dict[str, Any]:
+@app.get("/health", response_model=None)
+async def health() -> dict[str, Any] | Response:
     """Health check — returns ok; probes the default HTTP backend's /health when configured."""
     from gateway.backends.http_backend import HttpBackend
 
     if gateway_config is None or not isinstance(
         gateway_config.default_backend, HttpBackend
     ):
-        return {"status": "ok", "upstream": None}
+        return _static_json(_HEALTH_OK_BYTES)
 
     backend = gateway_config.default_backend
     probe_url = backend.base_url + "/health"
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(probe_url)
+        resp = await app.state.http_client.get(probe_url, timeout=5.0)
         if resp.status_code < 500:
             return {"status": "ok", "default_upstream": backend.base_url}
         return {
@@ -576,25 +970,24 @@ async def list_models() -> Response:
     if gateway_config is None or not isinstance(
         gateway_config.default_backend, HttpBackend
     ):
-        raise HTTPException(status_code=404, detail={"error": "not_found"})
+        return _static_json(_NOT_FOUND_BYTES, 404)
 
     backend = gateway_config.default_backend
     url = backend.base_url + "/v1/models"
     try:
-        async with httpx.AsyncClient(timeout=backend.timeout) as client:
-            resp = await client.get(url)
+        resp = await app.state.http_client.get(url, timeout=backend.timeout)
         return Response(
             content=resp.content,
             status_code=resp.status_code,
             media_type=resp.headers.get("content-type", "application/json"),
         )
     except httpx.TimeoutException:
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "upstream_unavailable", "detail": "upstream timed out"},
             status_code=504,
         )
     except httpx.RequestError as exc:
-        return JSONResponse(
+        return _JSONResponse(
             {"error": "upstream_unavailable", "detail": str(exc)},
             status_code=502,
         )
@@ -613,10 +1006,10 @@ async def metrics_json() -> dict[str, Any]:
     }
 
 
-@app.get("/v1/backends")
-async def list_backends() -> dict[str, Any]:
+@app.get("/v1/backends", response_model=None)
+async def list_backends() -> dict[str, Any] | Response:
     if gateway_config is None:
-        raise HTTPException(status_code=404, detail={"error": "not_found"})
+        return _static_json(_NOT_FOUND_BYTES, 404)
     return {
         "backends": [
             {"name": b.name, "type": type(b).__name__}
@@ -626,86 +1019,61 @@ async def list_backends() -> dict[str, Any]:
     }
 
 
-@app.post("/v1/chat/completions")
-async def chat_completions(
-    request: Request, _auth: None = Depends(check_auth)
-) -> Response:
-    start = time.monotonic()
-    request_id = (
-        request.headers.get("X-Request-ID")
-        or request.headers.get("Request-Id")
-        or str(uuid.uuid4())
-    )
-    technique = request.headers.get("X-Technique", "baseline")
-    server_profile = settings.vllm_server_profile
-    log = logging.LoggerAdapter(logger, {"request_id": request_id})
-
-    with _span(
-        "chat.completions",
-        dict(request.headers),
-        technique=technique,
-        server_profile=server_profile,
-    ) as span:
-        ACTIVE_REQUESTS.inc()
-        try:
-            response = await _handle_completions(
-                request, request_id, technique, server_profile, start, log
-            )
-            if span is not None:
-                span.set_attribute("http.status_code", response.status_code)
-            return response
-        finally:
-            ACTIVE_REQUESTS.dec()
-
-
 async def _handle_completions(
     request: Request,
     request_id: str,
     technique: str,
     server_profile: str,
     start: float,
-    log: logging.LoggerAdapter,
 ) -> Response:
     # Parse body
+    raw = await _read_body_capped(request, settings.max_body_bytes)
+    if raw is None:
+        logger.warning(
+            "request_id=%s Request body exceeds %d bytes",
+            request_id,
+            settings.max_body_bytes,
+        )
+        return _error_response(
+            413,
+            {"error": "request_too_large"},
+            (time.monotonic() - start) * 1000,
+            technique=technique,
+            server_profile=server_profile,
+        )
     try:
-        body = await request.json()
+        body = _loads(raw)
     except Exception as exc:
-        log.warning("Bad request body: %s", exc)
-        record_metrics(
+        logger.warning("request_id=%s Bad request body: %s", request_id, exc)
+        return _error_response(
             400,
+            {"error": "invalid_json"},
             (time.monotonic() - start) * 1000,
-            0,
-            0,
             technique=technique,
             server_profile=server_profile,
         )
-        return JSONResponse({"error": "invalid_json"}, status_code=400)
 
     # Basic structure check
     messages = body.get("messages")
     if not isinstance(messages, list) or not messages:
-        record_metrics(
+        return _error_response(
             400,
+            {"error": "invalid_messages"},
             (time.monotonic() - start) * 1000,
-            0,
-            0,
             technique=technique,
             server_profile=server_profile,
         )
-        return JSONResponse({"error": "invalid_messages"}, status_code=400)
 
     # Full validation
     error = _validate_body(body)
     if error:
-        record_metrics(
+        return _error_response(
             400,
+            {"error": error},
             (time.monotonic() - start) * 1000,
-            0,
-            0,
             technique=technique,
             server_profile=server_profile,
         )
-        return JSONResponse({"error": error}, status_code=400)
 
     stream = body.get("stream", False)
     model = body.get("model")
@@ -735,7 +1103,6 @@ async def _handle_completions(
             prompt,
             stream,
             start,
-            log,
             technique=technique,
             server_profile=server_profile,
         )
@@ -745,7 +1112,6 @@ async def _handle_completions(
             forward_body,
             stream,
             start,
-            log,
             technique=technique,
             server_profile=server_profile,
         )
@@ -754,7 +1120,6 @@ async def _handle_completions(
         prompt,
         stream,
         start,
-        log,
         technique=technique,
         server_profile=server_profile,
     )
@@ -770,14 +1135,14 @@ async def _handle_echo(
     prompt: str,
     stream: bool,
     start: float,
-    log: logging.LoggerAdapter,
     *,
     technique: str = "baseline",
     server_profile: str = "default",
 ) -> Response:
     content = f"Echo: {prompt}"
     prompt_tokens = len(prompt.split())
-    completion_tokens = len(content.split())
+    # "Echo: " + prompt splits into ["Echo:", *prompt.split()] — no second scan.
+    completion_tokens = prompt_tokens + 1
     latency_ms = (time.monotonic() - start) * 1000
 
     record_metrics(
@@ -788,8 +1153,10 @@ async def _handle_echo(
         technique=technique,
         server_profile=server_profile,
     )
-    log.info(
-        "POST /v1/chat/completions status=200 latency_ms=%.1f mode=echo", latency_ms
+    logger.info(
+        "request_id=%s POST /v1/chat/completions status=200 latency_ms=%.1f mode=echo",
+        request_id,
+        latency_ms,
     )
 
     e2e_s = latency_ms / 1000.0
@@ -822,25 +1189,18 @@ async def _handle_echo(
                 }
             ],
         }
-
-        async def _sse() -> AsyncGenerator[str, None]:
-            yield f"data: {json.dumps(chunk)}\n\n"
-            yield "data: [DONE]\n\n"
-
-        return StreamingResponse(
-            _sse(),
+        # The whole echo stream is known up front: send it as one body (one
+        # write) rather than a chunked response with a send per frame.
+        return Response(
+            b"data: " + _dumps(chunk) + b"\n\ndata: [DONE]\n\n",
             media_type="text/event-stream",
             headers={"X-Request-ID": request_id, "Cache-Control": "no-cache"},
         )
 
-    resp = build_response(
-        request_id,
-        content,
-        prompt_tokens=prompt_tokens,
-        completion_tokens=completion_tokens,
-        latency_ms=latency_ms,
+    resp = render_echo_response(
+        request_id, content, prompt_tokens, completion_tokens, latency_ms
     )
-    return JSONResponse(resp, headers={"X-Request-ID": request_id})
+    return _JSONResponse(resp, headers={"X-Request-ID": request_id})
 
 
 async def _handle_with_config(
@@ -850,7 +1210,6 @@ async def _handle_with_config(
     prompt: str,
     stream: bool,
     start: float,
-    log: logging.LoggerAdapter,
     *,
     technique: str = "baseline",
     server_profile: str = "default",
@@ -883,16 +1242,15 @@ async def _handle_with_config(
         est_tokens += forward_body.get("max_tokens", 0)
         if est_tokens > backend.max_model_len:
             latency_ms = (time.monotonic() - start) * 1000
-            record_metrics(
-                400, latency_ms, 0, 0, technique=technique, server_profile=server_profile
-            )
-            log.warning(
-                "Request rejected: estimated %d tokens exceeds backend '%s' limit %d",
+            logger.warning(
+                "request_id=%s Request rejected: estimated %d tokens exceeds backend '%s' limit %d",
+                request_id,
                 est_tokens,
                 backend.name,
                 backend.max_model_len,
             )
-            return JSONResponse(
+            return _error_response(
+                400,
                 {
                     "error": "context_too_long",
                     "message": (
@@ -902,8 +1260,10 @@ async def _handle_with_config(
                     "estimated_tokens": est_tokens,
                     "max_model_len": backend.max_model_len,
                 },
-                status_code=400,
-                headers={"X-Request-ID": request_id},
+                latency_ms,
+                request_id,
+                technique=technique,
+                server_profile=server_profile,
             )
 
     if stream:
@@ -913,7 +1273,6 @@ async def _handle_with_config(
                 backend.completions_url,
                 backend_body,
                 start,
-                log,
                 technique=technique,
                 server_profile=server_profile,
                 backend_name=backend.name,
@@ -923,47 +1282,59 @@ async def _handle_with_config(
             prompt,
             stream,
             start,
-            log,
             technique=technique,
             server_profile=server_profile,
         )
 
+    payload = _dumps(backend_body)
     backend_start = time.monotonic()
     _span_event("backend.request.start", backend=backend.name)
     try:
-        data = await backend.generate(backend_body, request_id)
+        data = await backend.generate(backend_body, request_id, payload=payload)
     except httpx.TimeoutException:
         latency_ms = (time.monotonic() - start) * 1000
-        record_metrics(
-            504, latency_ms, 0, 0, technique=technique, server_profile=server_profile
+        logger.error(
+            "request_id=%s Backend %s timeout after %.1f ms",
+            request_id,
+            backend.name,
+            latency_ms,
         )
-        log.error("Backend %s timeout after %.1f ms", backend.name, latency_ms)
-        return JSONResponse(
+        return _error_response(
+            504,
             {"error": "gateway_timeout"},
-            status_code=504,
-            headers={"X-Request-ID": request_id},
+            latency_ms,
+            request_id,
+            technique=technique,
+            server_profile=server_profile,
         )
     except httpx.RequestError as exc:
         latency_ms = (time.monotonic() - start) * 1000
-        record_metrics(
-            502, latency_ms, 0, 0, technique=technique, server_profile=server_profile
+        logger.error(
+            "request_id=%s Backend %s connection error: %s",
+            request_id,
+            backend.name,
+            exc,
         )
-        log.error("Backend %s connection error: %s", backend.name, exc)
-        return JSONResponse(
+        return _error_response(
+            502,
             {"error": "backend_unavailable"},
-            status_code=502,
-            headers={"X-Request-ID": request_id},
+            latency_ms,
+            request_id,
+            technique=technique,
+            server_profile=server_profile,
         )
     except RuntimeError as exc:
         latency_ms = (time.monotonic() - start) * 1000
-        record_metrics(
-            502, latency_ms, 0, 0, technique=technique, server_profile=server_profile
+        logger.error(
+            "request_id=%s Backend %s error: %s", request_id, backend.name, exc
         )
-        log.error("Backend %s error: %s", backend.name, exc)
-        return JSONResponse(
+        return _error_response(
+            502,
             {"error": "backend_error"},
-            status_code=502,
-            headers={"X-Request-ID": request_id},
+            latency_ms,
+            request_id,
+            technique=technique,
+            server_profile=server_profile,
         )
 
     backend_duration_s = time.monotonic() - backend_start
@@ -971,15 +1342,16 @@ async def _handle_with_config(
         backend=backend.name, technique=technique
     ).observe(backend_duration_s)
     REQUEST_SIZE_BYTES.labels(backend=backend.name, technique=technique).observe(
-        len(json.dumps(backend_body).encode())
+        len(payload)
     )
 
     latency_ms = (time.monotonic() - start) * 1000
     data = _normalize_response(data, request_id, latency_ms=latency_ms)
     data["backend"] = backend.name
 
+    content = _dumps(data)
     RESPONSE_SIZE_BYTES.labels(backend=backend.name, technique=technique).observe(
-        len(json.dumps(data).encode())
+        len(content)
     )
 
     usage = data["usage"]
@@ -1002,8 +1374,9 @@ async def _handle_with_config(
         completion_tokens=str(completion_tokens),
         backend_duration_ms=f"{backend_duration_s * 1000:.1f}",
     )
-    log.info(
-        "POST /v1/chat/completions status=200 latency_ms=%.1f backend_ms=%.1f mode=config backend=%s",
+    logger.info(
+        "request_id=%s POST /v1/chat/completions status=200 latency_ms=%.1f backend_ms=%.1f mode=config backend=%s",
+        request_id,
         latency_ms,
         backend_duration_s * 1000,
         backend.name,
@@ -1028,7 +1401,7 @@ async def _handle_with_config(
             completion_tokens=completion_tokens,
         )
     )
-    return JSONResponse(data, headers={"X-Request-ID": request_id})
+    return _JSONResponse(content, headers={"X-Request-ID": request_id})
 
 
 async def _handle_backend(
@@ -1036,7 +1409,6 @@ async def _handle_backend(
     body: dict[str, Any],
     stream: bool,
     start: float,
-    log: logging.LoggerAdapter,
     *,
     technique: str = "baseline",
     server_profile: str = "default",
@@ -1049,7 +1421,6 @@ async def _handle_backend(
             url,
             body,
             start,
-            log,
             technique=technique,
             server_profile=server_profile,
         )
@@ -1058,7 +1429,6 @@ async def _handle_backend(
         url,
         body,
         start,
-        log,
         technique=technique,
         server_profile=server_profile,
     )
@@ -1069,74 +1439,76 @@ async def _proxy_non_stream(
     url: str,
     body: dict[str, Any],
     start: float,
-    log: logging.LoggerAdapter,
     *,
     technique: str = "baseline",
     server_profile: str = "default",
     backend_name: str = "legacy",
 ) -> Response:
+    payload = _dumps(body)
     backend_start = time.monotonic()
     _span_event("backend.request.start", backend=backend_name)
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            resp = await client.post(
-                url, json=body, headers=_outgoing_headers(technique)
-            )
+        resp = await app.state.http_client.post(
+            url, content=payload, headers=_outgoing_headers(technique)
+        )
     except httpx.TimeoutException:
         latency_ms = (time.monotonic() - start) * 1000
-        record_metrics(
-            504, latency_ms, 0, 0, technique=technique, server_profile=server_profile
+        logger.error(
+            "request_id=%s Backend timeout after %.1f ms", request_id, latency_ms
         )
-        log.error("Backend timeout after %.1f ms", latency_ms)
-        return JSONResponse(
+        return _error_response(
+            504,
             {"error": "gateway_timeout"},
-            status_code=504,
-            headers={"X-Request-ID": request_id},
+            latency_ms,
+            request_id,
+            technique=technique,
+            server_profile=server_profile,
         )
     except httpx.RequestError as exc:
         latency_ms = (time.monotonic() - start) * 1000
-        record_metrics(
-            502, latency_ms, 0, 0, technique=technique, server_profile=server_profile
-        )
-        log.error("Backend connection error: %s", exc)
-        return JSONResponse(
+        logger.error("request_id=%s Backend connection error: %s", request_id, exc)
+        return _error_response(
+            502,
             {"error": "backend_unavailable"},
-            status_code=502,
-            headers={"X-Request-ID": request_id},
+            latency_ms,
+            request_id,
+            technique=technique,
+            server_profile=server_profile,
         )
 
-    backend_duration_s = time.monotonic() - backend_start
+    backend_done = time.monotonic()
+    backend_duration_s = backend_done - backend_start
 
     if resp.status_code >= 500:
-        latency_ms = (time.monotonic() - start) * 1000
-        record_metrics(
-            502, latency_ms, 0, 0, technique=technique, server_profile=server_profile
-        )
-        log.error("Backend returned %d", resp.status_code)
-        return JSONResponse(
+        latency_ms = (backend_done - start) * 1000
+        logger.error("request_id=%s Backend returned %d", request_id, resp.status_code)
+        return _error_response(
+            502,
             {"error": "backend_error"},
-            status_code=502,
-            headers={"X-Request-ID": request_id},
+            latency_ms,
+            request_id,
+            technique=technique,
+            server_profile=server_profile,
         )
 
     try:
-        data = resp.json()
+        data = _decode_backend_completion(resp.content)
     except Exception:
         latency_ms = (time.monotonic() - start) * 1000
-        record_metrics(
-            502, latency_ms, 0, 0, technique=technique, server_profile=server_profile
-        )
-        return JSONResponse(
+        return _error_response(
+            502,
             {"error": "backend_invalid_response"},
-            status_code=502,
-            headers={"X-Request-ID": request_id},
+            latency_ms,
+            request_id,
+            technique=technique,
+            server_profile=server_profile,
         )
 
     BACKEND_REQUEST_DURATION_SECONDS.labels(
         backend=backend_name, technique=technique
     ).observe(backend_duration_s)
     REQUEST_SIZE_BYTES.labels(backend=backend_name, technique=technique).observe(
-        len(json.dumps(body).encode())
+        len(payload)
     )
 
     latency_ms = (time.monotonic() - start) * 1000
@@ -1165,8 +1537,9 @@ async def _proxy_non_stream(
         completion_tokens=str(completion_tokens),
         backend_duration_ms=f"{backend_duration_s * 1000:.1f}",
     )
-    log.info(
-        "POST /v1/chat/completions status=%d latency_ms=%.1f backend_ms=%.1f mode=backend",
+    logger.info(
+        "request_id=%s POST /v1/chat/completions status=%d latency_ms=%.1f backend_ms=%.1f mode=backend",
+        request_id,
         resp.status_code,
         latency_ms,
         backend_duration_s * 1000,
@@ -1191,22 +1564,32 @@ async def _proxy_non_stream(
             completion_tokens=completion_tokens,
         )
     )
-    return JSONResponse(
+    return _JSONResponse(
         data, status_code=resp.status_code, headers={"X-Request-ID": request_id}
     )
 
 
+async def _chunks_then_eof(
+    chunks: AsyncIterator[bytes],
+) -> AsyncGenerator[bytes | None, None]:
+    """Yield ``chunks``, then a single ``None`` marking the end of the stream."""
+    async for chunk in chunks:
+        yield chunk
+    yield None
+
+
 async def _proxy_stream(
     request_id: str,
     url: str,
     body: dict[str, Any],
     start: float,
-    log: logging.LoggerAdapter,
     *,
     technique: str = "baseline",
     server_profile: str = "default",
     backend_name: str = "legacy",
 ) -> Response:
+    payload = _dumps(body)
+
     async def _stream_gen() -> AsyncGenerator[bytes, None]:
         prompt_tokens = 0
         completion_tokens = 0
@@ -1217,55 +1600,70 @@ async def _proxy_stream(
         chunk_count = 0
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                async with client.stream(
-                    "POST", url, json=body, headers=_outgoing_headers(technique)
-                ) as resp:
-                    if resp.status_code >= 500:
-                        latency_ms = (time.monotonic() - start) * 1000
-                        record_metrics(
-                            502,
-                            latency_ms,
-                            0,
-                            0,
-                            technique=technique,
-                            server_profile=server_profile,
-                        )
-                        log.error("Backend returned %d on stream", resp.status_code)
-                        yield json.dumps({"error": "backend_error"}).encode()
-                        return
-
-                    ttft_s: float | None = None
-                    async for line in resp.aiter_lines():
-                        encoded = (line + "\n").encode()
-                        yield encoded
-                        response_bytes += len(encoded)
-                        if line.startswith("data: ") and line != "data: [DONE]":
-                            chunk_count += 1
-                            now = time.monotonic()
-                            if first_chunk:
-                                ttft_s = now - start
-                                TTFT_SECONDS.observe(ttft_s)
-                                _span_event(
-                                    "stream.first_chunk", ttft_s=f"{ttft_s:.3f}"
-                                )
-                                first_chunk = False
-                            else:
-                                gap = now - last_chunk_time
-                                INTER_CHUNK_SECONDS.observe(gap)
-                                inter_chunk_delays.append(gap)
-                            last_chunk_time = now
-                            try:
-                                chunk = json.loads(line[6:])
-                                if usage := chunk.get("usage"):
-                                    prompt_tokens = usage.get("prompt_tokens", 0)
-                                    completion_tokens = usage.get(
-                                        "completion_tokens", 0
-                                    )
-                            except (json.JSONDecodeError, AttributeError):
-                                pass
-                    yield b"\n"
-                    response_bytes += 1
+            async with app.state.http_client.stream(
+                "POST", url, content=payload, headers=_outgoing_headers(technique)
+            ) as resp:
+                if resp.status_code >= 500:
+                    latency_ms = (time.monotonic() - start) * 1000
+                    record_metrics(
+                        502,
+                        latency_ms,
+                        0,
+                        0,
+                        technique=technique,
+                        server_profile=server_profile,
+                    )
+                    logger.error(
+                        "request_id=%s Backend returned %d on stream",
+                        request_id,
+                        resp.status_code,
+                    )
+                    yield _dumps({"error": "backend_error"})
+                    return
+
+                ttft_s: float | None = None
+                pending = bytearray()
+                # Forward backend bytes untouched; complete lines are scanned
+                # separately, only to derive chunk timing and usage metrics.
+                async for raw in _chunks_then_eof(resp.aiter_bytes()):
+                    if raw is None:
+                        # A final line without a trailing newline still counts.
+                        lines = [pending] if pending else []
+                    else:
+                        yield raw
+                        response_bytes += len(raw)
+                        pending += raw
+                        if b"\n" not in raw:
+                            continue
+                        cut = pending.rfind(b"\n")
+                        lines = pending[:cut].split(b"\n")
+                        del pending[: cut + 1]
+                    for line in lines:
+                        if not line.startswith(b"data: ") or line.startswith(
+                            b"data: [DONE]"
+                        ):
+                            continue
+                        chunk_count += 1
+                        now = time.monotonic()
+                        if first_chunk:
+                            ttft_s = now - start
+                            TTFT_SECONDS.observe(ttft_s)
+                            _span_event("stream.first_chunk", ttft_s=f"{ttft_s:.3f}")
+                            first_chunk = False
+                        else:
+                            gap = now - last_chunk_time
+                            INTER_CHUNK_SECONDS.observe(gap)
+                            inter_chunk_delays.append(gap)
+                        last_chunk_time = now
+                        if b'"usage"' not in line:
+                            continue
+                        try:
+                            chunk = _loads(line[6:])
+                            if usage := chunk.get("usage"):
+                                prompt_tokens = usage.get("prompt_tokens", 0)
+                                completion_tokens = usage.get("completion_tokens", 0)
+                        except (ValueError, AttributeError):
+                            pass
         except httpx.TimeoutException:
             latency_ms = (time.monotonic() - start) * 1000
             record_metrics(
@@ -1276,8 +1674,12 @@ async def _proxy_stream(
                 technique=technique,
                 server_profile=server_profile,
             )
-            log.error("Backend stream timeout after %.1f ms", latency_ms)
-            yield (json.dumps({"error": "gateway_timeout"}) + "\n").encode()
+            logger.error(
+                "request_id=%s Backend stream timeout after %.1f ms",
+                request_id,
+                latency_ms,
+            )
+            yield _dumps({"error": "gateway_timeout"}) + b"\n"
             return
         except httpx.RequestError as exc:
             latency_ms = (time.monotonic() - start) * 1000
@@ -1289,8 +1691,10 @@ async def _proxy_stream(
                 technique=technique,
                 server_profile=server_profile,
             )
-            log.error("Backend stream connection error: %s", exc)
-            yield (json.dumps({"error": "backend_unavailable"}) + "\n").encode()
+            logger.error(
+                "request_id=%s Backend stream connection error: %s", request_id, exc
+            )
+            yield _dumps({"error": "backend_unavailable"}) + b"\n"
             return
 
         latency_ms = (time.monotonic() - start) * 1000
@@ -1301,7 +1705,7 @@ async def _proxy_stream(
                 backend=backend_name, technique=technique
             ).observe(ttft_s)
         REQUEST_SIZE_BYTES.labels(backend=backend_name, technique=technique).observe(
-            len(json.dumps(body).encode())
+            len(payload)
         )
         RESPONSE_SIZE_BYTES.labels(backend=backend_name, technique=technique).observe(
             response_bytes
@@ -1325,8 +1729,9 @@ async def _proxy_stream(
             technique=technique,
             server_profile=server_profile,
         )
-        log.info(
-            "POST /v1/chat/completions status=200 latency_ms=%.1f mode=backend-stream",
+        logger.info(
+            "request_id=%s POST /v1/chat/completions status=200 latency_ms=%.1f mode=backend-stream",
+            request_id,
             latency_ms,
         )
         actual_ttft_s = ttft_s if ttft_s is not None else e2e_s
@@ -1366,17 +1771,132 @@ async def _proxy_stream(
 # ---------------------------------------------------------------------------
 
 
-def main() -> None:
+def _reuseport_socket(port: int) -> socket.socket:
+    """Bind a listening socket with SO_REUSEPORT so sibling workers share the port.
+
+    Each worker binds its own socket; the kernel then load-balances incoming
+    connections across them instead of all workers contending on one accept queue.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind(("0.0.0.0", port))
+    return sock
+
+
+def _serve(reuseport: bool) -> None:
+    """Run one gateway server process.
+
+    A single process exposes Prometheus itself. Prefork workers (``reuseport``)
+    only write to the shared multiprocess directory, which the supervisor serves.
+    """
     import uvicorn
 
     _setup_otel()
-    prometheus_client.start_http_server(settings.metrics_port)
-    logger.info("Prometheus metrics available on port %d", settings.metrics_port)
+    if not reuseport:
+        prometheus_client.start_http_server(settings.metrics_port)
+        logger.info("Prometheus metrics available on port %d", settings.metrics_port)
+
+    config = uvicorn.Config(
+        app,
+        host="0.0.0.0",
+        port=settings.port,
+        log_config=None,
+        backlog=settings.listen_backlog,
+    )
+    sockets = [_reuseport_socket(settings.port)] if reuseport else None
+    uvicorn.Server(config).run(sockets=sockets)
+
+
+def _exit_on_signal(signum: int, frame: Any) -> None:
+    raise SystemExit(0)
+
+
+def _run_worker(worker: int) -> int:
+    """Serve as prefork worker ``worker`` and return the process exit status."""
+    # uvicorn re-raises the shutdown signal after a graceful stop; exit cleanly
+    # instead of dying by signal (which would also drop queued log records).
+    signal.signal(signal.SIGTERM, _exit_on_signal)
+    signal.signal(signal.SIGINT, _exit_on_signal)
+    try:
+        _serve(reuseport=True)
+    except SystemExit as exc:
+        if exc.code is None or exc.code == 0:
+            return 0
+        logger.error("Worker %d exited with status %s", worker, exc.code)
+        return exc.code if isinstance(exc.code, int) else 1
+    except BaseException:
+        logger.exception("Worker %d failed", worker)
+        return 1
+    return 0
+
+
+def main() -> None:
+    workers = max(1, settings.workers)
+    if workers > 1 and not hasattr(socket, "SO_REUSEPORT"):
+        logger.warning("SO_REUSEPORT unavailable on this platform; using 1 worker")
+        workers = 1
 
     mode = f"backend={settings.backend_url}" if settings.backend_url else "echo mode"
-    logger.info("Inference gateway listening on port %d (%s)", settings.port, mode)
+    logger.info(
+        "Inference gateway listening on port %d (%s, workers=%d)",
+        settings.port,
+        mode,
+        workers,
+    )
+
+    if workers == 1:
+        _serve(reuseport=False)
+        return
+
+    # Prefork: the parent only supervises. Fork before any threads (metrics
+    # server, OTel exporter, log writer) exist; each worker sets those up itself.
+    _stop_log_listener()
+    children: dict[int, int] = {}
+    for worker in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                status = _run_worker(worker)
+            finally:
+                _stop_log_listener()
+                os._exit(status)
+        children[pid] = worker
+    _start_log_listener()
+
+    registry = prometheus_client.CollectorRegistry()
+    prometheus_multiprocess.MultiProcessCollector(registry)
+    prometheus_client.start_http_server(settings.metrics_port, registry=registry)
+    logger.info(
+        "Prometheus metrics for %d workers available on port %d",
+        workers,
+        settings.metrics_port,
+    )
 
-    uvicorn.run(app, host="0.0.0.0", port=settings.port, log_config=None)
+    def _stop_workers(signum: int, frame: Any) -> None:
+        for pid in list(children):
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, _stop_workers)
+    signal.signal(signal.SIGINT, _stop_workers)
+
+    # A worker that dies takes the whole gateway down rather than leaving it
+    # silently serving at reduced capacity.
+    failed = False
+    while children:
+        pid, wait_status = os.wait()
+        worker = children.pop(pid)
+        prometheus_multiprocess.mark_process_dead(pid)
+        code = os.waitstatus_to_exitcode(wait_status)
+        if code != 0:
+            logger.error("Worker %d (pid %d) exited with status %d", worker, pid, code)
+            if not failed:
+                failed = True
+                _stop_workers(signal.SIGTERM, None)
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import logging
 import uuid
 
 import httpx
@@ -173,6 +174,24 @@ def test_echo_usage_fields(gateway):
     assert "total_tokens" in usage
 
 
+def test_json_response_headers_match_starlette_guards():
+    resp = main._JSONResponse({"ok": True}, headers={"X-Request-ID": "r1"})
+    assert resp.raw_headers == [
+        (b"content-length", b"11"),
+        (b"content-type", b"application/json"),
+        (b"x-request-id", b"r1"),
+    ]
+
+    no_content = main._JSONResponse(b"", status_code=204)
+    assert b"content-length" not in dict(no_content.raw_headers)
+
+    custom = main._JSONResponse(
+        {"ok": True}, headers={"Content-Type": "application/problem+json"}
+    )
+    content_types = [v for k, v in custom.raw_headers if k == b"content-type"]
+    assert content_types == [b"application/problem+json"]
+
+
 # ---------------------------------------------------------------------------
 # Request-ID
 # ---------------------------------------------------------------------------
@@ -198,6 +217,16 @@ def test_request_id_generated(gateway):
     assert parsed.version == 4
 
 
+def test_new_request_id_is_canonical_uuid4():
+    ids = {main._new_request_id() for _ in range(100)}
+    assert len(ids) == 100
+    for rid in ids:
+        parsed = uuid.UUID(rid)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == rid
+
+
 def test_request_id_alt_header(gateway):
     rid = "alt-request-456"
     status, body, _ = _post(
@@ -241,6 +270,33 @@ def test_empty_messages_list(gateway):
     assert body["error"] == "invalid_messages"
 
 
+def test_oversized_body_rejected(gateway, monkeypatch):
+    monkeypatch.setattr(main.settings, "max_body_bytes", 64)
+    resp = gateway.post(
+        "/v1/chat/completions",
+        content=b"x" * 65,
+        headers={"Content-Type": "application/json"},
+    )
+    assert resp.status_code == 413
+    assert resp.json()["error"] == "request_too_large"
+
+
+def test_oversized_chunked_body_rejected(gateway, monkeypatch):
+    monkeypatch.setattr(main.settings, "max_body_bytes", 64)
+
+    def chunks():
+        for _ in range(10):
+            yield b"x" * 16
+
+    resp = gateway.post(
+        "/v1/chat/completions",
+        content=chunks(),
+        headers={"Content-Type": "application/json"},
+    )
+    assert resp.status_code == 413
+    assert resp.json()["error"] == "request_too_large"
+
+
 # ---------------------------------------------------------------------------
 # Echo streaming (SSE)
 # ---------------------------------------------------------------------------
@@ -284,6 +340,19 @@ def test_backend_success(backend_gateway):
     assert headers.get("X-Request-ID") is not None
 
 
+@respx.mock
+def test_backend_request_body_encoded_once(backend_gateway):
+    """The proxied body goes out as JSON bytes with an explicit content-type."""
+    route = respx.post("http://test-backend/v1/chat/completions").mock(
+        return_value=httpx.Response(200, json={"choices": []})
+    )
+    _post(backend_gateway, "/v1/chat/completions", COMPLETION_PAYLOAD)
+
+    sent = route.calls.last.request
+    assert sent.headers["content-type"] == "application/json"
+    assert json.loads(sent.content)["messages"] == COMPLETION_PAYLOAD["messages"]
+
+
 @respx.mock
 def test_backend_5xx(backend_gateway):
     respx.post("http://test-backend/v1/chat/completions").mock(
@@ -349,6 +418,39 @@ def test_metrics_prompt_tokens_echo(gateway):
     assert metrics_body["prompt_tokens_total"] == 2  # len("hello world".split()) == 2
 
 
+@pytest.mark.parametrize("prompt", ["hello world", "  padded\tprompt\n", ""])
+def test_echo_completion_tokens_match_word_count(gateway, prompt):
+    payload = {"messages": [{"role": "user", "content": prompt}]}
+    _, body, _ = _post(gateway, "/v1/chat/completions", payload)
+    usage = body["usage"]
+    assert usage["prompt_tokens"] == len(prompt.split())
+    assert usage["completion_tokens"] == len(f"Echo: {prompt}".split())
+
+
+def test_render_echo_response_shape():
+    rendered = main._loads(
+        main.render_echo_response("req-1", 'Echo: say "hi" \u00e9\n', 3, 4, 12.3456)
+    )
+    assert rendered == {
+        "id": "req-1",
+        "object": "chat.completion",
+        "model": "echo",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": 'Echo: say "hi" \u00e9\n'},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": 3,
+            "completion_tokens": 4,
+            "total_tokens": 7,
+            "latency_ms": 12.35,
+        },
+    }
+
+
 # ---------------------------------------------------------------------------
 # Extended validation (#1 + #6)
 # ---------------------------------------------------------------------------
@@ -662,6 +764,41 @@ def test_get_backends_endpoint(multi_backend_gateway):
     assert body["default"] == "local"
 
 
+def test_http_backend_pool_opened_for_app_lifetime(monkeypatch):
+    """HttpBackends get a pooled client at startup and release it at shutdown."""
+    from gateway.backends.echo import EchoBackend
+
+    echo = EchoBackend(name="local")
+    remote = HttpBackend(name="remote", url="http://test-backend")
+    config = GatewayConfig(backends=[echo, remote], default_backend=echo)
+    monkeypatch.setattr(main, "gateway_config", config)
+
+    with TestClient(main.app, raise_server_exceptions=False):
+        assert isinstance(remote._client, httpx.AsyncClient)
+    assert remote._client is None
+
+
+@respx.mock
+def test_http_backend_sends_pre_encoded_payload():
+    """generate() sends the caller's encoded bytes as-is instead of re-encoding."""
+    import asyncio
+
+    route = respx.post("http://test-backend/v1/chat/completions").mock(
+        return_value=httpx.Response(200, json={"choices": []})
+    )
+    backend = HttpBackend(name="remote", url="http://test-backend")
+    body = {"messages": [{"role": "user", "content": "hi"}]}
+    payload = main._dumps(body)
+
+    asyncio.run(backend.generate(body, "req-1", payload=payload))
+    asyncio.run(backend.generate(body, "req-2"))
+
+    first, second = route.calls
+    assert first.request.content == payload
+    assert second.request.content == payload
+    assert first.request.headers["content-type"] == "application/json"
+
+
 def test_v1_models_echo_only_404(gateway):
     """GET /v1/models returns 404 when no HTTP backend is configured."""
     status, body = _get(gateway, "/v1/models")
@@ -1039,6 +1176,126 @@ def test_backend_extra_fields_stripped(backend_gateway):
     }
 
 
+def test_decode_backend_completion_only_normalized_fields():
+    """Large backend bodies decode to just model/usage/choices; the parser is reused."""
+    logprobs = [{"token": "hi", "logprob": -0.1}] * 200
+    raw = json.dumps(
+        {
+            "id": "backend-id",
+            "model": "llama-3",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "hi"},
+                    "finish_reason": "stop",
+                    "logprobs": {"content": logprobs},
+                }
+            ],
+            "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+            "timings": {"prompt_n": 3, "predicted_n": 2},
+        }
+    ).encode()
+    assert len(raw) >= main._LAZY_DECODE_MIN_BYTES
+
+    expected = {
+        "model": "llama-3",
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": "hi"},
+                "finish_reason": "stop",
+            }
+        ],
+    }
+    if main._simd_parser is None:
+        expected = json.loads(raw)
+    for _ in range(2):
+        assert main._decode_backend_completion(raw) == expected
+
+    with pytest.raises(ValueError):
+        main._decode_backend_completion(b"not json")
+
+
+def test_decode_backend_completion_small_body_parsed_fully():
+    """Bodies under the lazy-decode threshold take the plain full parse."""
+    body = {
+        "id": "backend-id",
+        "model": "llama-3",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "hi"}}],
+    }
+    assert main._decode_backend_completion(json.dumps(body).encode()) == body
+
+
+def _large_completion(**overrides) -> bytes:
+    """A backend completion padded with logprobs past the lazy-decode threshold."""
+    body = {
+        "id": "backend-id",
+        "model": "llama-3",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": "hi"},
+                "finish_reason": "stop",
+                "logprobs": {"content": [{"token": "hi", "logprob": -0.1}] * 200},
+            }
+        ],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+        **overrides,
+    }
+    raw = json.dumps(body).encode()
+    assert len(raw) >= main._LAZY_DECODE_MIN_BYTES
+    return raw
+
+
+def test_decode_backend_completion_bad_shape_does_not_pin_parser():
+    """A non-array ``choices`` falls back to a full parse without leaking proxies."""
+    bad = _large_completion(choices={"a": 1}, padding="x" * 5000)
+    held = main._decode_backend_completion(bad)  # kept alive on purpose
+    assert held == json.loads(bad)
+
+    good = main._decode_backend_completion(_large_completion())
+    assert good["choices"] == [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "hi"},
+            "finish_reason": "stop",
+        }
+    ]
+    if main._simd_parser is not None:
+        assert "id" not in good  # still the lazy path, not the fallback
+
+
+def test_decode_backend_completion_bigint_falls_back():
+    big = 123456789012345678901234567890
+    raw = _large_completion(
+        usage={"prompt_tokens": big, "completion_tokens": 2, "total_tokens": 5}
+    )
+    prompt_tokens = main._decode_backend_completion(raw)["usage"]["prompt_tokens"]
+    assert float(prompt_tokens) == float(big)
+
+
+@respx.mock
+def test_bad_large_backend_body_does_not_break_later_requests(backend_gateway):
+    bad = _large_completion(choices={"a": 1}, padding="x" * 5000)
+    good = _large_completion()
+    respx.post("http://test-backend/v1/chat/completions").mock(
+        side_effect=[
+            httpx.Response(200, content=bad),
+            httpx.Response(200, content=good),
+            httpx.Response(200, content=good),
+        ]
+    )
+    resp = backend_gateway.post("/v1/chat/completions", json=COMPLETION_PAYLOAD)
+    assert resp.status_code >= 500
+    for _ in range(2):
+        status, body, _ = _post(
+            backend_gateway, "/v1/chat/completions", COMPLETION_PAYLOAD
+        )
+        assert status == 200
+        assert body["choices"][0]["message"]["content"] == "hi"
+
+
 @respx.mock
 def test_streaming_logs_usage(backend_gateway):
     """Streaming backend that sends usage in final chunk updates metrics."""
@@ -1070,6 +1327,59 @@ def test_streaming_logs_usage(backend_gateway):
     assert metrics_body["completion_tokens_total"] == 3
 
 
+@respx.mock
+def test_streaming_usage_on_unterminated_final_line(backend_gateway):
+    """A last SSE line with no trailing newline is still scanned for usage."""
+    usage_chunk = json.dumps(
+        {"choices": [], "usage": {"prompt_tokens": 6, "completion_tokens": 2}}
+    )
+    respx.post("http://test-backend/v1/chat/completions").mock(
+        return_value=httpx.Response(
+            200,
+            content=f"data: {usage_chunk}".encode(),
+            headers={"Content-Type": "text/event-stream"},
+        )
+    )
+
+    payload = {**COMPLETION_PAYLOAD, "stream": True}
+    backend_gateway.post("/v1/chat/completions", json=payload)  # consume stream
+
+    _, metrics_body = _get(backend_gateway, "/metrics")
+    assert metrics_body["prompt_tokens_total"] == 6
+    assert metrics_body["completion_tokens_total"] == 2
+
+
+@respx.mock
+def test_streaming_forwards_backend_bytes_verbatim(backend_gateway):
+    """SSE bytes pass through unchanged, even when a frame spans network chunks."""
+    usage_chunk = json.dumps(
+        {"choices": [], "usage": {"prompt_tokens": 4, "completion_tokens": 1}}
+    ).encode()
+    parts = [
+        b'data: {"choices": [{"delta": {"content": "h',
+        b'i"}}]}\r\n\r\ndata: ' + usage_chunk + b"\r\n\r\n",
+        b"data: [DONE]\r\n\r\n",
+    ]
+
+    async def _body():
+        for part in parts:
+            yield part
+
+    respx.post("http://test-backend/v1/chat/completions").mock(
+        return_value=httpx.Response(
+            200, content=_body(), headers={"Content-Type": "text/event-stream"}
+        )
+    )
+
+    payload = {**COMPLETION_PAYLOAD, "stream": True}
+    resp = backend_gateway.post("/v1/chat/completions", json=payload)
+    assert resp.content == b"".join(parts)
+
+    _, metrics_body = _get(backend_gateway, "/metrics")
+    assert metrics_body["prompt_tokens_total"] == 4
+    assert metrics_body["completion_tokens_total"] == 1
+
+
 @respx.mock
 def test_streaming_timeout_yields_error(backend_gateway):
     """Streaming path records 504 metrics and yields error JSON when backend times out."""
@@ -1574,3 +1884,200 @@ def test_docker_compose_nginx_exporter():
     assert "nginx_status" in cmd, (
         "nginx_status scrape URI missing from exporter command"
     )
+
+
+# ---------------------------------------------------------------------------
+# Prefork workers (SO_REUSEPORT)
+# ---------------------------------------------------------------------------
+
+requires_reuseport = pytest.mark.skipif(
+    not hasattr(main.socket, "SO_REUSEPORT"), reason="SO_REUSEPORT unavailable"
+)
+
+
+@requires_reuseport
+def test_reuseport_socket_shares_port_between_workers():
+    first = main._reuseport_socket(0)
+    try:
+        port = first.getsockname()[1]
+        second = main._reuseport_socket(port)
+        try:
+            for sock in (first, second):
+                assert sock.getsockopt(main.socket.SOL_SOCKET, main.socket.SO_REUSEPORT)
+        finally:
+            second.close()
+    finally:
+        first.close()
+
+
+@pytest.fixture
+def serve_calls(monkeypatch):
+    """Capture what _serve() hands to uvicorn and the metrics server."""
+    import uvicorn
+
+    calls: dict = {"metrics_ports": []}
+
+    def fake_run(self, sockets=None):
+        calls["sockets"] = sockets
+
+    monkeypatch.setattr(uvicorn.Server, "run", fake_run)
+    monkeypatch.setattr(
+        main.prometheus_client,
+        "start_http_server",
+        lambda port, **kw: calls["metrics_ports"].append(port),
+    )
+    monkeypatch.setattr(main.settings, "port", 0)
+    return calls
+
+
+@requires_reuseport
+def test_serve_prefork_worker_binds_reuseport_socket(serve_calls):
+    main._serve(reuseport=True)
+    (sock,) = serve_calls["sockets"]
+    try:
+        assert sock.getsockopt(main.socket.SOL_SOCKET, main.socket.SO_REUSEPORT)
+    finally:
+        sock.close()
+    # Workers only write to the multiprocess directory; the supervisor serves it.
+    assert serve_calls["metrics_ports"] == []
+
+
+def test_serve_single_process_exposes_metrics(serve_calls):
+    main._serve(reuseport=False)
+    assert serve_calls["sockets"] is None
+    assert serve_calls["metrics_ports"] == [main.settings.metrics_port]
+
+
+@pytest.mark.parametrize(
+    ("exc", "status"),
+    [(OSError("Address already in use"), 1), (SystemExit(1), 1), (SystemExit(0), 0)],
+)
+def test_run_worker_exit_status(monkeypatch, caplog, exc, status):
+    def fail(reuseport):
+        raise exc
+
+    monkeypatch.setattr(main.signal, "signal", lambda *args: None)
+    monkeypatch.setattr(main, "_serve", fail)
+    assert main._run_worker(3) == status
+    assert ("Worker 3" in caplog.text) == bool(status)
+
+
+@pytest.fixture
+def supervisor(monkeypatch):
+    """Run main()'s prefork supervisor loop against scripted fork/wait results."""
+    state: dict = {"waits": [], "kills": [], "dead": [], "handlers": {}}
+    pids = iter([101, 102])
+
+    def fake_wait():
+        step = state["waits"].pop(0)
+        return step() if callable(step) else step
+
+    monkeypatch.setattr(main.settings, "workers", 2)
+    monkeypatch.setattr(main.os, "fork", lambda: next(pids))
+    monkeypatch.setattr(main.os, "wait", fake_wait)
+    monkeypatch.setattr(
+        main.os, "kill", lambda pid, sig: state["kills"].append((pid, sig))
+    )
+    monkeypatch.setattr(
+        main.signal,
+        "signal",
+        lambda sig, handler: state["handlers"].__setitem__(sig, handler),
+    )
+    monkeypatch.setattr(
+        main.prometheus_multiprocess, "mark_process_dead", state["dead"].append
+    )
+    monkeypatch.setattr(
+        main.prometheus_multiprocess, "MultiProcessCollector", lambda registry: None
+    )
+    monkeypatch.setattr(
+        main.prometheus_client, "start_http_server", lambda port, **kw: None
+    )
+    monkeypatch.setattr(main, "_stop_log_listener", lambda: None)
+    monkeypatch.setattr(main, "_start_log_listener", lambda: None)
+    return state
+
+
+@requires_reuseport
+def test_supervisor_clean_exit(supervisor):
+    supervisor["waits"] = [(102, 0), (101, 0)]
+    main.main()
+    assert supervisor["dead"] == [102, 101]
+    assert supervisor["kills"] == []
+
+
+@requires_reuseport
+def test_supervisor_worker_failure_stops_others_and_exits_nonzero(supervisor):
+    # Worker 0 exits with status 1; worker 1 then exits from the forwarded SIGTERM.
+    supervisor["waits"] = [(101, 1 << 8), (102, 0)]
+    with pytest.raises(SystemExit) as excinfo:
+        main.main()
+    assert excinfo.value.code == 1
+    assert supervisor["kills"] == [(102, main.signal.SIGTERM)]
+    assert supervisor["dead"] == [101, 102]
+
+
+@requires_reuseport
+def test_supervisor_forwards_termination_signals(supervisor):
+    def sigterm_then_exit(pid):
+        def step():
+            supervisor["handlers"][main.signal.SIGTERM](main.signal.SIGTERM, None)
+            return pid, 0
+
+        return step
+
+    supervisor["waits"] = [sigterm_then_exit(101), (102, 0)]
+    main.main()
+    assert set(supervisor["handlers"]) == {main.signal.SIGTERM, main.signal.SIGINT}
+    assert supervisor["kills"] == [
+        (101, main.signal.SIGTERM),
+        (102, main.signal.SIGTERM),
+    ]
+    assert supervisor["dead"] == [101, 102]
+
+
+# ---------------------------------------------------------------------------
+# Queued logging
+# ---------------------------------------------------------------------------
+
+
+def test_setup_logging_writes_through_queue_listener(monkeypatch, capsys):
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    monkeypatch.setattr(main, "_log_handler", None)
+    monkeypatch.setattr(main, "_log_listener", None)
+    fork_hooks = []
+    monkeypatch.setattr(main.atexit, "register", lambda *args: None)
+    monkeypatch.setattr(main.os, "register_at_fork", lambda **kw: fork_hooks.append(kw))
+
+    main._setup_logging()
+    try:
+        assert root.handlers == [main._log_handler]
+        assert fork_hooks == [{"after_in_child": main._start_log_listener}]
+        main.logger.info("queued %s", "record")
+        main._stop_log_listener()
+        assert "INFO queued record" in capsys.readouterr().err
+
+        # A forked child has no writer thread; the hook starts a fresh one.
+        fork_hooks[0]["after_in_child"]()
+        main.logger.warning("after fork")
+        main._stop_log_listener()
+        assert "WARNING after fork" in capsys.readouterr().err
+    finally:
+        main._stop_log_listener()
+
+
+def test_batch_queue_listener_writes_drained_records_together():
+    batches = []
+
+    class Recorder(main._BatchStreamHandler):
+        def emit_batch(self, records):
+            batches.append([r.getMessage() for r in records])
+
+    log_queue = main.queue.SimpleQueue()
+    for i in range(3):
+        log_queue.put(logging.makeLogRecord({"msg": "line %d", "args": (i,)}))
+    listener = main._BatchQueueListener(log_queue, Recorder())
+    listener.start()
+    listener.stop()
+    assert batches == [["line 0", "line 1", "line 2"]]